@@ -1,6 +1,11 @@
 import pandas as pd
 import glob
+import csv
+import sqlite3
+import tempfile
 import logging
+import multiprocessing
+from logging.handlers import QueueHandler, QueueListener
 import re
 from pathlib import Path
 from rich.logging import RichHandler
@@ -9,12 +14,105 @@ from rich.console import Console
 from datetime import datetime
 import os
 import sys
-from collections import Counter
-import unicodedata
+from functools import reduce
+from contextlib import closing
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# pandas' default missing-value markers, so both parsers agree on nulls
+_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null'
+]
+
+# The string dtype pandas uses for dtype=str (object, or str on pandas 3)
+_STR_DTYPE = pd.Series([], dtype=str).dtype
 
 # Set up Rich console for beautiful output
 console = Console()
 
+# Basic patterns that indicate a phone number
+_PHONE_PATS = [
+    r'^\+?[\d\s\-\.\(\)\[\]\{\}]{8,}$',  # General phone format with optional +
+    r'\d{3}[\s\-\.]?\d{3}[\s\-\.]?\d{4}',  # US/NANP format
+    r'\+\d{1,3}[\s\-\.]?\d+',  # International format
+    r'\(\d{3}\)[\s\-\.]?\d{3}[\s\-\.]?\d{4}',  # (123) 456-7890 format
+]
+
+# Same phone patterns as one alternation, so each value is scanned once
+_PHONE_PATS_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in _PHONE_PATS))
+
+def _compile_alternation(patterns):
+    """Compile literal patterns into a single regex matching any of them."""
+    return re.compile('|'.join(re.escape(p) for p in sorted(patterns, key=len, reverse=True)))
+
+# Column name patterns for name detection, with their scores
+_NAME_PATTERNS = {
+    # English variations
+    'name': 5, 'full name': 5, 'full_name': 5, 'firstname': 4, 'lastname': 4,
+    'first name': 4, 'last name': 4, 'customer name': 4,
+    # Portuguese
+    'nome': 5, 'nomes': 5, 'nome completo': 5, 'nome_completo': 5,
+    # Spanish
+    'nombre': 5, 'nombres': 5, 'nombre completo': 5, 'apellido': 4,
+    # French
+    'nom': 5, 'prénom': 4, 'prenom': 4, 'nom complet': 5,
+    # German
+    'name': 5, 'vorname': 4, 'nachname': 4, 'vollständiger name': 5,
+    # Italian
+    'nome': 5, 'cognome': 4, 'nome completo': 5,
+    # Generic
+    'contact': 3, 'customer': 3, 'client': 3, 'pessoa': 3, 'person': 3,
+    'usuario': 3, 'user': 3, 'lead': 3
+}
+
+# One alternation per score tier, highest score first
+_NAME_PATTERN_TIERS = [
+    (tier, _compile_alternation(p for p, score in _NAME_PATTERNS.items() if score == tier))
+    for tier in sorted(set(_NAME_PATTERNS.values()), reverse=True)
+]
+
+# Column name patterns for each field type, in order of preference
+_COLUMN_PATTERNS = {
+    'name': ['name', 'full name', 'contact', 'customer', 'lead', 'person', 'cliente', 'nombre'],
+    'email': ['email', 'e-mail', 'mail', 'correo', 'e_mail', 'e mail', 'correio'],
+    'phone': ['phone', 'telephone', 'mobile', 'cell', 'contact', 'tel', 'telefono', 'number', 'celular', 'fone', 'telefone']
+}
+
+_COLUMN_PATTERN_RES = {
+    field_type: _compile_alternation(patterns)
+    for field_type, patterns in _COLUMN_PATTERNS.items()
+}
+
+# Column name patterns for phone detection, with their scores
+_PHONE_PATTERNS = {
+    # English
+    'phone': 5, 'telephone': 5, 'mobile': 5, 'cell': 5, 'contact': 3,
+    # Portuguese
+    'telefone': 5, 'celular': 5, 'fone': 5, 'tel': 4,
+    # Spanish
+    'telefono': 5, 'movil': 5, 'celular': 5,
+    # French
+    'téléphone': 5, 'portable': 5, 'mobile': 5,
+    # German
+    'telefon': 5, 'handy': 5, 'mobiltelefon': 5,
+    # Italian
+    'telefono': 5, 'cellulare': 5, 'mobile': 5,
+    # Generic
+    'contact': 3, 'number': 3, 'phone number': 4, 'tel': 4
+}
+
+_PHONE_PATTERN_RE = _compile_alternation(_PHONE_PATTERNS)
+
 def setup_logging():
     """Configure logging with both file and console handlers."""
     log_dir = Path("logs")
@@ -30,107 +128,109 @@ def setup_logging():
     )
     return logging.getLogger("leads_unifier")
 
-logger = setup_logging()
+# Handlers are attached by setup_logging() in main(), so worker processes
+# re-importing this module do not open log files of their own
+logger = logging.getLogger("leads_unifier")
 
-def is_likely_name(value):
+def init_worker(log_queue):
+    """Send a worker process's log records to the parent through a queue."""
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
+
+def is_likely_name_series(values):
     """
-    Analyze if a string is likely to be a name using multiple heuristics.
+    Analyze which strings in a Series are likely to be names using
+    multiple heuristics. Returns a boolean mask.
     """
-    if pd.isna(value):
-        return False
-        
-    value_str = str(value).strip()
-    if not value_str:
-        return False
-        
-    # Convert to NFKD normalized form and remove diacritics
-    normalized = unicodedata.normalize('NFKD', value_str).encode('ASCII', 'ignore').decode('ASCII')
+    # Work on object dtype so the character classes below use Python's
+    # Unicode-aware re; Arrow-backed strings run them through RE2, where
+    # \w and \d are ASCII-only and accented letters would count as special
+    value_str = values.astype(object).str.strip()
     
     # Basic checks
-    word_count = len(value_str.split())
-    if word_count > 6 or word_count < 1:  # Most names are 1-6 words
-        return False
-        
-    # Calculate ratios
-    total_chars = len(value_str)
-    if total_chars < 2:  # Too short to be a name
-        return False
-        
+    word_count = value_str.str.split().str.len()
+    total_chars = value_str.str.len()
+    
     # Count different types of characters
-    alpha_count = sum(c.isalpha() or c.isspace() for c in value_str)
-    digit_count = sum(c.isdigit() for c in value_str)
+    alpha_count = value_str.str.count(r'[^\W\d_]|\s')
+    digit_count = value_str.str.count(r'\d')
     special_count = total_chars - alpha_count - digit_count
+    alpha_ratio = alpha_count / total_chars.where(total_chars > 0)
     
-    # Names should be mostly letters
-    alpha_ratio = alpha_count / total_chars
-    if alpha_ratio < 0.7:  # At least 70% should be letters or spaces
-        return False
-        
-    # Names shouldn't have many digits
-    if digit_count > 0:
-        return False
-        
-    # Check capitalization pattern
-    words = value_str.split()
-    properly_capitalized = all(word[0].isupper() for word in words if word)
+    # Every word must start with an uppercase letter
+    first_chars = value_str.str.replace(r'\s*(\S)\S*', r'\1', regex=True)
+    properly_capitalized = (
+        first_chars.str.isupper() & ~value_str.str.contains(r'(?:^|\s)[\W\d_]', regex=True)
+    )
     
     # Calculate final score
-    score = 0
-    score += alpha_ratio * 5  # Up to 5 points for letter ratio
-    score += 2 if properly_capitalized else 0  # 2 points for proper capitalization
-    score += 1 if 2 <= word_count <= 4 else 0  # Common name length
-    score -= special_count * 0.5  # Penalty for special characters
+    score = (
+        alpha_ratio * 5
+        + properly_capitalized * 2
+        + word_count.between(2, 4) * 1
+        - special_count * 0.5
+    )
     
-    return score > 3.5  # Threshold determined empirically
+    return (
+        word_count.between(1, 6)
+        & (total_chars >= 2)
+        & (alpha_ratio >= 0.7)
+        & (digit_count == 0)
+        & (score > 3.5)
+    )
 
 def analyze_column_names(columns):
     """
     Analyze column names for name patterns across different languages.
     Returns a dictionary of columns and their scores.
     """
-    name_patterns = {
-        # English variations
-        'name': 5, 'full name': 5, 'full_name': 5, 'firstname': 4, 'lastname': 4,
-        'first name': 4, 'last name': 4, 'customer name': 4,
-        # Portuguese
-        'nome': 5, 'nomes': 5, 'nome completo': 5, 'nome_completo': 5,
-        # Spanish
-        'nombre': 5, 'nombres': 5, 'nombre completo': 5, 'apellido': 4,
-        # French
-        'nom': 5, 'prénom': 4, 'prenom': 4, 'nom complet': 5,
-        # German
-        'name': 5, 'vorname': 4, 'nachname': 4, 'vollständiger name': 5,
-        # Italian
-        'nome': 5, 'cognome': 4, 'nome completo': 5,
-        # Generic
-        'contact': 3, 'customer': 3, 'client': 3, 'pessoa': 3, 'person': 3,
-        'usuario': 3, 'user': 3, 'lead': 3
-    }
     
     scored_columns = {}
     for col in columns:
         col_lower = col.lower().strip()
         
         # Check for exact matches
-        if col_lower in name_patterns:
-            scored_columns[col] = name_patterns[col_lower]
+        if col_lower in _NAME_PATTERNS:
+            scored_columns[col] = _NAME_PATTERNS[col_lower]
             continue
             
-        # Check for partial matches
+        # Check for partial matches, best scoring tier first
         score = 0
-        for pattern, pattern_score in name_patterns.items():
-            if pattern in col_lower:
-                score = max(score, pattern_score - 1)  # Slightly lower score for partial matches
+        for pattern_score, tier_re in _NAME_PATTERN_TIERS:
+            if tier_re.search(col_lower):
+                score = pattern_score - 1  # Slightly lower score for partial matches
+                break
                 
         if score > 0:
             scored_columns[col] = score
             
     return scored_columns
 
-def find_name_column(df):
+def build_column_samples(df):
+    """
+    Convert each column's non-null values to strings once, so the
+    column detectors can share them instead of re-casting per detector.
+    """
+    return {col: df[col].dropna().astype(str) for col in df.columns}
+
+def likely_ratio(sample, classifier):
+    """
+    Fraction of sample values flagged by a vectorized classifier.
+    Each distinct value is classified once and weighted by its count,
+    since columns often repeat the same values.
+    """
+    codes, uniques = pd.factorize(sample)
+    mask = classifier(pd.Series(uniques, dtype=sample.dtype)).to_numpy(dtype=bool)
+    return mask[codes].mean()
+
+def find_name_column(df, samples=None):
     """
     Find the most likely name column using multiple methods.
     """
+    if samples is None:
+        samples = build_column_samples(df)
+    
     # First, analyze column names
     name_scores = analyze_column_names(df.columns)
     
@@ -138,8 +238,16 @@ def find_name_column(df):
     for col in df.columns:
         if col not in name_scores:
             # Sample the column (up to 100 values) to check content
-            sample = df[col].dropna().astype(str).head(100)
-            name_like_ratio = sum(sample.apply(is_likely_name)) / len(sample) if len(sample) > 0 else 0
+            sample = samples[col].head(100)
+            if len(sample) == 0:
+                continue
+            
+            # Values with digits never look like names, so skip the full
+            # analysis when too many have them for the column to qualify
+            if sample.str.contains(r'\d').mean() >= 0.3:
+                continue
+            
+            name_like_ratio = likely_ratio(sample, is_likely_name_series)
             
             if name_like_ratio > 0.7:  # If more than 70% of values look like names
                 name_scores[col] = 3 * name_like_ratio  # Up to 3 points for content
@@ -152,92 +260,57 @@ def find_name_column(df):
     
     return None
 
-def is_likely_phone(value):
+def is_likely_phone_series(values):
     """
-    Check if a value matches common phone number patterns.
+    Check which strings in a Series match common phone number patterns.
+    Returns a boolean mask.
     """
-    if pd.isna(value):
-        return False
-    
-    value_str = str(value)
-    
-    # Remove common separators for checking length
-    cleaned = re.sub(r'[\s\-\.\(\)\[\]\{\}]', '', value_str)
+    # Object dtype keeps \d Unicode-aware, as in is_likely_name_series
+    values = values.astype(object)
     
     # Check maximum length (15 digits per international standard)
-    digit_count = sum(c.isdigit() for c in cleaned)
-    if digit_count > 15 or digit_count < 8:
-        return False
-    
-    # Basic patterns that indicate a phone number
-    patterns = [
-        r'^\+?[\d\s\-\.\(\)\[\]\{\}]{8,}$',  # General phone format with optional +
-        r'\d{3}[\s\-\.]?\d{3}[\s\-\.]?\d{4}',  # US/NANP format
-        r'\+\d{1,3}[\s\-\.]?\d+',  # International format
-        r'\(\d{3}\)[\s\-\.]?\d{3}[\s\-\.]?\d{4}',  # (123) 456-7890 format
-    ]
-    
-    return any(re.search(pattern, value_str) for pattern in patterns)
-
-def normalize_phone(phone):
-    """Enhanced phone number normalization."""
-    if pd.isna(phone):
-        return None
-        
-    phone_str = str(phone)
-    
-    # Keep original string for length checking
-    digits = ''.join(c for c in phone_str if c.isdigit())
-    
-    # Check if number has acceptable length
-    if len(digits) < 8 or len(digits) > 15:
-        return None
+    digit_count = values.str.count(r'\d')
+    is_phone = digit_count.between(8, 15)
     
-    # Preserve '+' prefix if it exists
-    if phone_str.startswith('+'):
-        return f"+{digits}"
-    return digits
+    # Only run the pattern match on values with a plausible digit count
+    if is_phone.any():
+        is_phone[is_phone] = values[is_phone].str.contains(_PHONE_PATS_RE)
+    return is_phone
 
-def normalize_email(email):
+def normalize_email_series(emails):
     """Normalize email addresses by converting to lowercase and stripping whitespace."""
-    if pd.isna(email):
-        return None
-    email_str = str(email).lower().strip()
-    return email_str if '@' in email_str else None
+    email_str = emails.str.lower().str.strip()
+    return email_str.where(email_str.str.contains('@', regex=False, na=False))
 
-def find_column(df, field_type):
+def find_column(df, field_type, samples=None):
     """
     Find a column that likely contains the specified field type.
     Returns the most likely column name or None if not found.
     """
-    column_patterns = {
-        'name': ['name', 'full name', 'contact', 'customer', 'lead', 'person', 'cliente', 'nombre'],
-        'email': ['email', 'e-mail', 'mail', 'correo', 'e_mail', 'e mail', 'correio'],
-        'phone': ['phone', 'telephone', 'mobile', 'cell', 'contact', 'tel', 'telefono', 'number', 'celular', 'fone', 'telefone']
-    }
+    if samples is None:
+        samples = build_column_samples(df)
     
     # Convert all column names to lowercase for matching
     columns_lower = {col.lower(): col for col in df.columns}
     
     # First try exact matches
-    for pattern in column_patterns[field_type]:
+    for pattern in _COLUMN_PATTERNS[field_type]:
         if pattern in columns_lower:
             logger.info(f"Found exact match for {field_type}: {columns_lower[pattern]}")
             return columns_lower[pattern]
     
     # Then try partial matches
     for col_lower, original_col in columns_lower.items():
-        for pattern in column_patterns[field_type]:
-            if pattern in col_lower:
-                logger.info(f"Found partial match for {field_type}: {original_col}")
-                return original_col
+        if _COLUMN_PATTERN_RES[field_type].search(col_lower):
+            logger.info(f"Found partial match for {field_type}: {original_col}")
+            return original_col
     
     # If still not found, try fuzzy matching based on content (for emails and phones)
     if field_type == 'email':
         for col in df.columns:
             # Check if column contains @ symbol in majority of non-null values
-            if df[col].dtype == 'object' and df[col].notna().any():
-                sample = df[col].dropna().astype(str)
+            sample = samples[col]
+            if df[col].dtype == 'object' and len(sample) > 0:
                 if sample.str.contains('@').mean() > 0.5:
                     logger.info(f"Found email column by content analysis: {col}")
                     return col
@@ -245,8 +318,8 @@ def find_column(df, field_type):
     elif field_type == 'phone':
         for col in df.columns:
             # Check if column contains mostly numbers
-            if df[col].dtype in ['object', 'int64', 'float64'] and df[col].notna().any():
-                sample = df[col].dropna().astype(str)
+            sample = samples[col]
+            if df[col].dtype in ['object', 'int64', 'float64'] and len(sample) > 0:
                 if sample.str.contains(r'\d').mean() > 0.7:
                     logger.info(f"Found phone column by content analysis: {col}")
                     return col
@@ -254,27 +327,13 @@ def find_column(df, field_type):
     logger.warning(f"[yellow]Could not find column for {field_type}[/yellow]")
     return None
 
-def find_phone_columns(df):
+def find_phone_columns(df, samples=None):
     """
     Find all columns that might contain phone numbers based on both
     column names and content analysis.
     """
-    phone_patterns = {
-        # English
-        'phone': 5, 'telephone': 5, 'mobile': 5, 'cell': 5, 'contact': 3,
-        # Portuguese
-        'telefone': 5, 'celular': 5, 'fone': 5, 'tel': 4,
-        # Spanish
-        'telefono': 5, 'movil': 5, 'celular': 5,
-        # French
-        'téléphone': 5, 'portable': 5, 'mobile': 5,
-        # German
-        'telefon': 5, 'handy': 5, 'mobiltelefon': 5,
-        # Italian
-        'telefono': 5, 'cellulare': 5, 'mobile': 5,
-        # Generic
-        'contact': 3, 'number': 3, 'phone number': 4, 'tel': 4
-    }
+    if samples is None:
+        samples = build_column_samples(df)
     
     phone_columns = []
     
@@ -283,19 +342,26 @@ def find_phone_columns(df):
         score = 0
         col_lower = col.lower()
         
-        # Score based on column name
-        for pattern, pattern_score in phone_patterns.items():
-            if pattern == col_lower:
-                score += pattern_score
-            elif pattern in col_lower:
-                score += pattern_score - 1
+        # Score based on column name, skipping names that match no pattern
+        if _PHONE_PATTERN_RE.search(col_lower):
+            for pattern, pattern_score in _PHONE_PATTERNS.items():
+                if pattern == col_lower:
+                    score += pattern_score
+                elif pattern in col_lower:
+                    score += pattern_score - 1
             
         # Score based on content analysis
         if df[col].dtype in ['object', 'int64', 'float64']:
-            sample = df[col].dropna().astype(str)
+            sample = samples[col]
+            
+            # Fast reject: columns with no phone-like name whose first values
+            # contain no digits at all are not worth analyzing
+            if score == 0 and not sample.head(5).str.contains(r'\d').any():
+                continue
+            
             if len(sample) > 0:
                 # Calculate percentage of values that look like phone numbers
-                phone_like_ratio = sum(sample.apply(is_likely_phone)) / len(sample)
+                phone_like_ratio = likely_ratio(sample, is_likely_phone_series)
                 score += phone_like_ratio * 4  # Weight content analysis heavily
                 
                 # Additional score if values have consistent length
@@ -313,20 +379,240 @@ def find_phone_columns(df):
     
     return [col for col, _ in phone_columns]
 
-def merge_phone_numbers(row, phone_cols):
+def normalize_phone_series(phones):
+    """
+    Normalize a column of phone numbers to digits, keeping a leading '+'.
+    Invalid or missing numbers become NaN so columns can be coalesced.
+    """
+    # Object dtype keeps \D Unicode-aware, as in is_likely_phone_series
+    phone_str = phones.fillna('').astype(str).astype(object)
+    
+    # Keep only digits, then check length (8-15 digits)
+    digits = phone_str.str.replace(r'\D', '', regex=True)
+    valid = digits.str.len().between(8, 15)
+    
+    # Preserve '+' prefix if it exists
+    normalized = digits.where(~phone_str.str.startswith('+'), '+' + digits)
+    return normalized.where(valid)
+
+def merge_phone_numbers(df, phone_cols):
     """
     Merge phone numbers from multiple columns, taking the best available number.
-    Returns the first valid phone number found after normalization.
+    Returns a Series with the first valid phone number found in each row.
+    """
+    normalized = [normalize_phone_series(df[col]) for col in phone_cols]
+    return reduce(lambda first, second: first.combine_first(second), normalized)
+
+def deduplicate_contacts(conn):
+    """
+    Remove duplicate contacts from the staging table by email, then by phone.
+    For each duplicated value the row with the highest completeness is kept,
+    the earliest one on ties. Rows missing the value are never treated as
+    duplicates of each other.
+    """
+    for field in ['email', 'phone']:
+        conn.execute(f"""
+            DELETE FROM contacts
+            WHERE {field} IS NOT NULL AND rowid NOT IN (
+                SELECT row_id FROM (
+                    SELECT rowid AS row_id, ROW_NUMBER() OVER (
+                        PARTITION BY {field} ORDER BY completeness DESC, rowid
+                    ) AS rank
+                    FROM contacts
+                    WHERE {field} IS NOT NULL
+                )
+                WHERE rank = 1
+            )
+        """)
+
+def find_phone_candidates(csv_file, columns, nrows=100):
+    """
+    Find the columns find_phone_columns could still pick up by content,
+    reading only the first rows of the file. A column is left out only when
+    its first five values contain no digit, which is exactly what makes
+    find_phone_columns skip a column whose name matches no phone pattern.
+    Returns None if the file cannot be read this way.
+    """
+    try:
+        head = pd.read_csv(csv_file, dtype=str, usecols=columns, nrows=nrows, on_bad_lines='warn', encoding_errors='ignore')
+    except Exception:
+        return None
+    
+    candidates = []
+    for col in columns:
+        first_values = head[col].dropna().head(5)
+        
+        # If the read stopped early, later rows may hold the first values
+        if len(first_values) < 5 and len(head) == nrows:
+            candidates.append(col)
+        elif first_values.str.contains(r'\d').any():
+            candidates.append(col)
+    
+    return candidates
+
+def find_columns_to_load(csv_file, columns):
+    """
+    Pick the columns to load, mostly from the header.
+    Returns their names, or None when the names alone are not
+    conclusive and the whole file is needed for content analysis.
+    """
+    # Content analysis scores a name column at most 3, so a stronger
+    # name match cannot be overridden by it
+    name_scores = analyze_column_names(columns)
+    if not name_scores or max(name_scores.values()) <= 3:
+        return None
+    
+    email_cols = [col for col in columns if _COLUMN_PATTERN_RES['email'].search(col.lower())]
+    phone_cols = [col for col in columns if _PHONE_PATTERN_RE.search(col.lower())]
+    if not email_cols or not phone_cols:
+        return None
+    
+    selected = set(name_scores) | set(email_cols) | set(phone_cols)
+    
+    # Phone sources are also found by content, so keep every other column
+    # that could still qualify
+    others = [col for col in columns if col not in selected]
+    if others:
+        candidates = find_phone_candidates(csv_file, others)
+        if candidates is None:
+            return None
+        selected.update(candidates)
+    
+    return [col for col in columns if col in selected]
+
+def read_csv_pyarrow(csv_file, header, usecols=None):
+    """
+    Read a CSV file with the multithreaded pyarrow parser, every column as
+    strings. Returns None when the result would differ from the C parser's.
+    """
+    expected = list(usecols if usecols is not None else header)
+    
+    # Declare every column as string up front; with engine='pyarrow',
+    # pandas lets Arrow infer numbers first, losing leading zeros
+    convert_options = pacsv.ConvertOptions(
+        column_types={col: pa.string() for col in expected},
+        include_columns=usecols,
+        null_values=_NA_VALUES,
+        strings_can_be_null=True
+    )
+    try:
+        # Short or long rows raise instead of being dropped; the C parser
+        # pads short rows and keeps them
+        table = pacsv.read_csv(
+            csv_file,
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=convert_options
+        )
+    except Exception:
+        return None
+    
+    # pyarrow does not mangle duplicate or blank header names like the C
+    # parser does, so only trust it when the columns come out the same
+    columns = pd.Index(table.column_names)
+    if columns.has_duplicates or set(columns) != set(expected):
+        return None
+    if any(not pa.types.is_string(table.schema.field(col).type) for col in expected):
+        return None
+    
+    return table.to_pandas()[expected].astype(_STR_DTYPE)
+
+def read_csv_file(csv_file, header, usecols=None):
+    """
+    Read a CSV file with all string columns to prevent type inference.
+    Tries the pyarrow parser when it is installed and falls back to the
+    C parser whenever pyarrow cannot reproduce its result.
+    """
+    if HAS_PYARROW:
+        df = read_csv_pyarrow(csv_file, header, usecols)
+        if df is not None:
+            return df
+    
+    return pd.read_csv(csv_file, dtype=str, usecols=usecols, on_bad_lines='warn', encoding_errors='ignore', memory_map=True)
+
+def process_csv_file(csv_file):
+    """
+    Read one CSV file and extract its normalized contacts.
+    Returns a DataFrame with name, email, phone and completeness columns,
+    or None on error.
+    """
+    file_name = Path(csv_file).name
+    logger.info(f"\n[green]Processing file:[/green] {file_name}")
+    
+    try:
+        # Scan the header first so wide files only load the columns we need
+        header = pd.read_csv(csv_file, nrows=0, encoding_errors='ignore').columns
+        usecols = find_columns_to_load(csv_file, header)
+        
+        df = read_csv_file(csv_file, header, usecols)
+        
+        # Find columns for each field type, casting each column only once
+        samples = build_column_samples(df)
+        
+        name_col = find_name_column(df, samples)  # Using new name detection
+        email_col = find_column(df, 'email', samples)
+        phone_cols = find_phone_columns(df, samples)
+        
+        found_columns = {
+            'name': name_col,
+            'email': email_col,
+            'phone_columns': phone_cols
+        }
+        
+        logger.info(f"[blue]Found columns:[/blue] {', '.join(f'{k}: {v}' for k, v in found_columns.items() if v)}")
+        
+        # Create a new DataFrame with standardized columns
+        contacts_df = pd.DataFrame()
+        
+        # Extract and normalize data
+        if name_col:
+            contacts_df['name'] = df[name_col].str.strip()
+        else:
+            contacts_df['name'] = None
+        
+        if email_col:
+            contacts_df['email'] = normalize_email_series(df[email_col])
+        else:
+            contacts_df['email'] = None
+        
+        # Handle phone numbers from multiple columns
+        if phone_cols:
+            contacts_df['phone'] = merge_phone_numbers(df, phone_cols)
+        else:
+            contacts_df['phone'] = None
+        
+        # Blank out empty strings and score completeness (number of filled
+        # fields) from a single mask, then remove rows with nothing filled
+        filled = contacts_df.notna() & (contacts_df != '')
+        contacts_df = contacts_df.where(filled)
+        contacts_df['completeness'] = filled.sum(axis=1).astype('int8')
+        valid_contacts = contacts_df[contacts_df['completeness'] > 0]
+        
+        logger.info(f"[green]Successfully extracted[/green] {len(valid_contacts)} contacts from {file_name}")
+        
+        return valid_contacts
+        
+    except Exception as e:
+        logger.error(f"[red]Error processing {file_name}: {str(e)}[/red]")
+        return None
+
+def map_in_order(executor, fn, items, window):
     """
-    phones = []
-    for col in phone_cols:
-        if pd.notna(row[col]):
-            normalized = normalize_phone(row[col])
-            if normalized:
-                phones.append(normalized)
+    Like executor.map, but keeps at most `window` calls in flight.
+    Yields (item, result) pairs in input order. Finished results wait in
+    the parent until they are consumed, so bounding the window bounds
+    how many of them are held in memory at once.
+    """
+    items = iter(items)
+    pending = deque()
+    for item in islice(items, window):
+        pending.append((item, executor.submit(fn, item)))
     
-    # Return the first valid phone number found
-    return phones[0] if phones else None
+    while pending:
+        item, future = pending.popleft()
+        result = future.result()
+        for next_item in islice(items, 1):
+            pending.append((next_item, executor.submit(fn, next_item)))
+        yield item, result
 
 def process_csvs(input_dir="input/*.csv", output_file="output/combined_contacts.csv"):
     """Process all CSV files and combine contact information."""
@@ -341,114 +627,80 @@ def process_csvs(input_dir="input/*.csv", output_file="output/combined_contacts.
         logger.error("[red]No CSV files found in the input directory![/red]")
         return
 
-    # Initialize empty DataFrame to store all contacts
-    all_contacts = pd.DataFrame(columns=['name', 'email', 'phone'])
-    
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console
-    ) as progress:
+    # Stage contacts in an on-disk SQLite table so memory stays bounded by
+    # the files in flight, and let SQLite do the deduplication
+    with tempfile.TemporaryDirectory() as tmp_dir, \
+            closing(sqlite3.connect(os.path.join(tmp_dir, 'contacts.db'))) as conn, \
+            Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=console
+            ) as progress:
+        conn.execute("CREATE TABLE contacts (name TEXT, email TEXT, phone TEXT, completeness INTEGER)")
         main_task = progress.add_task("[cyan]Processing CSV files...", total=len(csv_files))
         
-        for csv_file in csv_files:
-            file_name = Path(csv_file).name
-            logger.info(f"\n[green]Processing file:[/green] {file_name}")
-            
-            try:
-                # Read CSV with all string columns to prevent type inference
-                df = pd.read_csv(csv_file, dtype=str, on_bad_lines='warn', encoding_errors='ignore')
-                
-                # Find columns for each field type
-                name_col = find_name_column(df)  # Using new name detection
-                email_col = find_column(df, 'email')
-                phone_cols = find_phone_columns(df)
-                
-                found_columns = {
-                    'name': name_col,
-                    'email': email_col,
-                    'phone_columns': phone_cols
-                }
-                
-                logger.info(f"[blue]Found columns:[/blue] {', '.join(f'{k}: {v}' for k, v in found_columns.items() if v)}")
-                
-                # Create a new DataFrame with standardized columns
-                contacts_df = pd.DataFrame()
-                
-                # Extract and normalize data
-                if name_col:
-                    contacts_df['name'] = df[name_col].fillna('').astype(str).apply(lambda x: x.strip() or None)
-                else:
-                    contacts_df['name'] = None
-                
-                if email_col:
-                    contacts_df['email'] = df[email_col].apply(normalize_email)
-                else:
-                    contacts_df['email'] = None
-                
-                # Handle phone numbers from multiple columns
-                if phone_cols:
-                    contacts_df['phone'] = df.apply(lambda row: merge_phone_numbers(row, phone_cols), axis=1)
-                else:
-                    contacts_df['phone'] = None
-                
-                # Remove rows where all fields are None or empty strings
-                contacts_df = contacts_df.replace('', None)
-                valid_contacts = contacts_df.dropna(how='all')
-                
-                logger.info(f"[green]Successfully extracted[/green] {len(valid_contacts)} contacts from {file_name}")
-                
-                # Append to main DataFrame
-                all_contacts = pd.concat([all_contacts, valid_contacts], ignore_index=True)
-                
-            except Exception as e:
-                logger.error(f"[red]Error processing {file_name}: {str(e)}[/red]")
-            
-            progress.advance(main_task)
+        # Files are independent, so parse and normalize them in parallel.
+        # Results arrive in input order, keeping deduplication stable.
+        max_workers = min(len(csv_files), os.cpu_count() or 1)
         
-        # Remove duplicates
-        initial_count = len(all_contacts)
+        # Workers log through a queue so records are written by this
+        # process's handlers: one log file, printed above the progress bar
+        log_queue = multiprocessing.Queue()
+        listener = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+        listener.start()
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker, initargs=(log_queue,)) as executor:
+                for csv_file, valid_contacts in map_in_order(executor, process_csv_file, csv_files, max_workers):
+                    if valid_contacts is not None:
+                        try:
+                            valid_contacts.to_sql('contacts', conn, if_exists='append', index=False, chunksize=10_000)
+                        except Exception as e:
+                            logger.error(f"[red]Error processing {Path(csv_file).name}: {str(e)}[/red]")
+                    progress.advance(main_task)
+        finally:
+            listener.stop()
         
-        # Sort by completeness (number of non-null fields)
-        all_contacts['completeness'] = all_contacts.notna().sum(axis=1)
-        all_contacts = all_contacts.sort_values('completeness', ascending=False)
+        initial_count = conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
         
         # Remove duplicates based on email OR phone, keeping the most complete record
-        deduped_contacts = all_contacts.drop_duplicates(subset=['email'], keep='first')
-        deduped_contacts = deduped_contacts.drop_duplicates(subset=['phone'], keep='first')
-        
-        # Remove helper column
-        deduped_contacts = deduped_contacts.drop('completeness', axis=1)
+        deduplicate_contacts(conn)
         
-        duplicates_removed = initial_count - len(deduped_contacts)
+        final_count = conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+        duplicates_removed = initial_count - final_count
         
-        # Save to CSV
-        deduped_contacts.to_csv(output_file, index=False)
+        # Stream the result to CSV in input order
+        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(['name', 'email', 'phone'])
+            writer.writerows(conn.execute("SELECT name, email, phone FROM contacts ORDER BY rowid"))
         
         # Log final statistics
         logger.info("\n[bold green]Processing Complete![/bold green]")
         logger.info(f"[blue]Total files processed:[/blue] {len(csv_files)}")
         logger.info(f"[blue]Total contacts found:[/blue] {initial_count}")
         logger.info(f"[blue]Duplicates removed:[/blue] {duplicates_removed}")
-        logger.info(f"[blue]Final unique contacts:[/blue] {len(deduped_contacts)}")
+        logger.info(f"[blue]Final unique contacts:[/blue] {final_count}")
         logger.info(f"[blue]Output saved to:[/blue] {output_file}")
         
         # Display sample of the data
-        if not deduped_contacts.empty:
+        if final_count:
             logger.info("\n[bold blue]Sample of processed data:[/bold blue]")
-            console.print(deduped_contacts.head().to_string())
+            sample = pd.read_sql_query("SELECT name, email, phone FROM contacts ORDER BY rowid LIMIT 5", conn)
+            console.print(sample.to_string())
             
             # Display stats about filled values
-            filled_stats = deduped_contacts.notna().sum()
+            filled_stats = conn.execute("SELECT COUNT(name), COUNT(email), COUNT(phone) FROM contacts").fetchone()
             logger.info("\n[bold blue]Field statistics:[/bold blue]")
-            for field, count in filled_stats.items():
-                percentage = (count / len(deduped_contacts)) * 100
+            for field, count in zip(['name', 'email', 'phone'], filled_stats):
+                percentage = (count / final_count) * 100
                 logger.info(f"{field}: {count} filled values ({percentage:.1f}%)")
 
 def main():
     """Main entry point with error handling."""
+    setup_logging()
+    
     try:
         console.print("[bold magenta]Starting Leads Unifier[/bold magenta]")
         
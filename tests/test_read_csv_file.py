@@ -0,0 +1,59 @@
+import importlib.util
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+SCRIPT = Path(__file__).resolve().parent.parent / "leads-unifier.py"
+
+
+@pytest.fixture(scope="module")
+def unifier():
+    """Load the script as a module."""
+    spec = importlib.util.spec_from_file_location("leads_unifier", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_with_c_parser(csv_file, usecols=None):
+    return pd.read_csv(csv_file, dtype=str, usecols=usecols, on_bad_lines='warn', encoding_errors='ignore')
+
+
+@pytest.mark.parametrize("content", [
+    # Digit-only columns with leading zeros
+    "Nome,Email,Telefone\nAna,ana@x.com,011987654321\nBia,bia@x.com,0011\n",
+    # Same, with blanks and missing-value markers in the digit columns
+    "Nome,Email,Telefone,Celular\nAna,ana@x.com,011987654321,\nBia,,,00551199\nCid,NA,0011,N/A\n",
+    # Values pyarrow would otherwise infer as floats or booleans
+    "Nome,Flag,Score\nAna,false,1e5\nBia,true,\nCid,,2\n",
+])
+@pytest.mark.parametrize("usecols", [None, ["Nome"]])
+def test_pyarrow_matches_c_parser(unifier, tmp_path, content, usecols):
+    csv_file = tmp_path / "leads.csv"
+    csv_file.write_text(content, encoding="utf-8")
+    header = pd.read_csv(csv_file, nrows=0).columns
+
+    df = unifier.read_csv_pyarrow(csv_file, header, usecols)
+
+    assert df is not None
+    pd.testing.assert_frame_equal(df, read_with_c_parser(csv_file, usecols))
+
+
+@pytest.mark.parametrize("content", [
+    # Short row, padded by the C parser
+    "Nome,Email,Telefone\nAna,ana@x.com,011987654321\nBia,bia@x.com\n",
+    # Duplicate header names, mangled by the C parser
+    "Nome,Email,Telefone,Telefone\nAna,ana@x.com,,011987654321\n",
+    # Blank header name, named 'Unnamed: 3' by the C parser
+    "Nome,Email,Telefone,\nAna,ana@x.com,011987654321,\n",
+])
+def test_read_csv_file_falls_back_to_c_parser(unifier, tmp_path, content):
+    csv_file = tmp_path / "leads.csv"
+    csv_file.write_text(content, encoding="utf-8")
+    header = pd.read_csv(csv_file, nrows=0).columns
+
+    assert unifier.read_csv_pyarrow(csv_file, header) is None
+    pd.testing.assert_frame_equal(unifier.read_csv_file(csv_file, header), read_with_c_parser(csv_file))